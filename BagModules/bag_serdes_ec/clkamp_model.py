@@ -22,11 +22,6 @@
 #
 ########################################################################################################################
 
-from __future__ import (absolute_import, division,
-                        print_function, unicode_literals)
-# noinspection PyUnresolvedReferences,PyCompatibility
-from builtins import *
-
 import os
 import pkg_resources
 
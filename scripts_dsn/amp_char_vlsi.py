@@ -181,8 +181,8 @@ def run_main(prj):
     fname = 'specs_test/serdes_ec/analog/diffamp.yaml'
     fg_load_list = [6, 8, 10, 12, 14]
 
-    with open(fname, 'r') as f:
-        specs = yaml.load(f)
+    with open(fname, 'rb') as f:
+        specs = yaml.load(f, Loader=yaml.CLoader)
 
     impl_lib = specs['impl_lib']
 
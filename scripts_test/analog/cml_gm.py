@@ -14,8 +14,8 @@ def run_main(prj):
     root_name = 'specs_test/serdes_ec'
     test_fname = os.path.join(root_name, 'analog/cml_gm_info.yaml')
     if not os.path.isfile(test_fname):
-        with open(os.path.join(root_name, 'passives/cml_load.yaml'), 'r') as f:
-            dep_specs = yaml.load(f)
+        with open(os.path.join(root_name, 'passives/cml_load.yaml'), 'rb') as f:
+            dep_specs = yaml.load(f, Loader=yaml.CLoader)
 
         impl_lib = dep_specs['impl_lib']
         grid_specs = dep_specs['routing_grid']
@@ -30,10 +30,10 @@ def run_main(prj):
             yaml.dump(save_info, f)
     else:
         with open(test_fname, 'r') as f:
-            save_info = yaml.load(f)
+            save_info = yaml.load(f, Loader=yaml.Loader)
 
-    with open(os.path.join(root_name, 'analog/cml_gm.yaml'), 'r') as f:
-        specs = yaml.load(f)
+    with open(os.path.join(root_name, 'analog/cml_gm.yaml'), 'rb') as f:
+        specs = yaml.load(f, Loader=yaml.CLoader)
 
     specs['params'].update(save_info)
     prj.generate_cell(specs, CMLGmPMOS, debug=True)
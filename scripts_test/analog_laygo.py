@@ -84,8 +84,8 @@ def generate(prj, specs, use_cybagoa=False):
 
 
 if __name__ == '__main__':
-    with open('specs_test/analog_laygo.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/analog_laygo.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
@@ -17,8 +17,8 @@ def run_main(prj, gen_lay=True, gen_sch=False, debug=False):
                 'buffer4.yaml',
                 ]
 
-    with open(os.path.join(root, buf_list[0]), 'r') as f:
-        specs = yaml.load(f)
+    with open(os.path.join(root, buf_list[0]), 'rb') as f:
+        specs = yaml.load(f, Loader=yaml.CLoader)
 
     impl_lib = specs['impl_lib']
     grid_specs = specs['routing_grid']
@@ -28,8 +28,8 @@ def run_main(prj, gen_lay=True, gen_sch=False, debug=False):
     lay_list = []
     sch_list = []
     for spec_fname in buf_list:
-        with open(os.path.join(root, spec_fname), 'r') as f:
-            specs = yaml.load(f)
+        with open(os.path.join(root, spec_fname), 'rb') as f:
+            specs = yaml.load(f, Loader=yaml.CLoader)
 
         cell_name = specs['impl_cell']
         params = specs['params']
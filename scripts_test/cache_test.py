@@ -29,8 +29,8 @@ class CacheTest(TemplateBase):
 
 
 if __name__ == '__main__':
-    with open('specs_test/cache_test.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/cache_test.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
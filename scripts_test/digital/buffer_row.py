@@ -8,8 +8,8 @@ from digital_ec.layout.stdcells.core import StdCellWrapper
 
 
 if __name__ == '__main__':
-    with open('specs_test/serdes_ec/digital/buffer_row.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/serdes_ec/digital/buffer_row.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
@@ -13,8 +13,8 @@ def run_main(prj):
     root_dir = 'specs_test/serdes_ec/passives'
     spec_fname = 'term_rx.yaml'
 
-    with open(os.path.join(root_dir, spec_fname), 'r') as f:
-        specs = yaml.load(f)
+    with open(os.path.join(root_dir, spec_fname), 'rb') as f:
+        specs = yaml.load(f, Loader=yaml.CLoader)
 
     prj.generate_cell(specs, TermRX, debug=True)
     # prj.generate_cell(specs, TermRX, gen_sch=True, debug=True)
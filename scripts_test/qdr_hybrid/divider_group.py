@@ -14,8 +14,8 @@ def run_main(prj):
     root_name = 'specs_test/serdes_ec/qdr_hybrid'
     test_fname = os.path.join(root_name, 'divider_group_info.yaml')
     if not os.path.isfile(test_fname):
-        with open(os.path.join(root_name, 'tap1_summer.yaml'), 'r') as f:
-            sum_specs = yaml.load(f)
+        with open(os.path.join(root_name, 'tap1_summer.yaml'), 'rb') as f:
+            sum_specs = yaml.load(f, Loader=yaml.CLoader)
 
         impl_lib = sum_specs['impl_lib']
         grid_specs = sum_specs['routing_grid']
@@ -31,10 +31,10 @@ def run_main(prj):
             yaml.dump(div_info, f)
     else:
         with open(test_fname, 'r') as f:
-            div_info = yaml.load(f)
+            div_info = yaml.load(f, Loader=yaml.Loader)
 
-    with open(os.path.join(root_name, 'divider_group.yaml'), 'r') as f:
-        div_specs = yaml.load(f)
+    with open(os.path.join(root_name, 'divider_group.yaml'), 'rb') as f:
+        div_specs = yaml.load(f, Loader=yaml.CLoader)
 
     div_specs['params'].update(div_info)
     prj.generate_cell(div_specs, DividerGroup, debug=True)
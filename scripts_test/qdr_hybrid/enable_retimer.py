@@ -14,8 +14,8 @@ def run_main(prj):
     root_name = 'specs_test/serdes_ec/qdr_hybrid'
     test_fname = os.path.join(root_name, 'enable_retimer_info.yaml')
     if not os.path.isfile(test_fname):
-        with open(os.path.join(root_name, 'tap1_summer.yaml'), 'r') as f:
-            sum_specs = yaml.load(f)
+        with open(os.path.join(root_name, 'tap1_summer.yaml'), 'rb') as f:
+            sum_specs = yaml.load(f, Loader=yaml.CLoader)
 
         impl_lib = sum_specs['impl_lib']
         grid_specs = sum_specs['routing_grid']
@@ -29,10 +29,10 @@ def run_main(prj):
             yaml.dump(en_div_info, f)
     else:
         with open(test_fname, 'r') as f:
-            en_div_info = yaml.load(f)
+            en_div_info = yaml.load(f, Loader=yaml.Loader)
 
-    with open(os.path.join(root_name, 'enable_retimer.yaml'), 'r') as f:
-        retime_specs = yaml.load(f)
+    with open(os.path.join(root_name, 'enable_retimer.yaml'), 'rb') as f:
+        retime_specs = yaml.load(f, Loader=yaml.CLoader)
 
     retime_specs['params'].update(en_div_info)
 
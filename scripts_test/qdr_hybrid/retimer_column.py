@@ -8,8 +8,8 @@ from serdes_ec.layout.qdr_hybrid.sampler import RetimerColumn
 
 
 if __name__ == '__main__':
-    with open('specs_test/serdes_ec/qdr_hybrid/retimer_column.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/serdes_ec/qdr_hybrid/retimer_column.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
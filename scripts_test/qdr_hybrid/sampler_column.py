@@ -14,8 +14,8 @@ def run_main(prj):
     root_name = 'specs_test/serdes_ec/qdr_hybrid'
     test_fname = os.path.join(root_name, 'sampler_column_info.yaml')
     if not os.path.isfile(test_fname):
-        with open(os.path.join(root_name, 'tap1_summer.yaml'), 'r') as f:
-            sum_specs = yaml.load(f)
+        with open(os.path.join(root_name, 'tap1_summer.yaml'), 'rb') as f:
+            sum_specs = yaml.load(f, Loader=yaml.CLoader)
 
         impl_lib = sum_specs['impl_lib']
         grid_specs = sum_specs['routing_grid']
@@ -31,10 +31,10 @@ def run_main(prj):
             yaml.dump(sampler_info, f)
     else:
         with open(test_fname, 'r') as f:
-            sampler_info = yaml.load(f)
+            sampler_info = yaml.load(f, Loader=yaml.Loader)
 
-    with open(os.path.join(root_name, 'sampler_column.yaml'), 'r') as f:
-        samp_specs = yaml.load(f)
+    with open(os.path.join(root_name, 'sampler_column.yaml'), 'rb') as f:
+        samp_specs = yaml.load(f, Loader=yaml.CLoader)
 
     samp_specs['params'].update(sampler_info)
 
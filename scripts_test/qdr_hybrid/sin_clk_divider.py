@@ -10,12 +10,13 @@ from serdes_ec.layout.qdr_hybrid.tap1 import Tap1Summer
 from serdes_ec.layout.laygo.divider import SinClkDivider
 
 
-def run_main(prj):
+def run_main(prj, spec_fname='sin_clk_divider.yaml', info_fname='sin_clk_div_info.yaml',
+             gen_sch=False):
     root_name = 'specs_test/serdes_ec/qdr_hybrid'
-    test_fname = os.path.join(root_name, 'sin_clk_div_info.yaml')
+    test_fname = os.path.join(root_name, info_fname)
     if not os.path.isfile(test_fname):
-        with open(os.path.join(root_name, 'tap1_summer.yaml'), 'r') as f:
-            sum_specs = yaml.load(f)
+        with open(os.path.join(root_name, 'tap1_summer.yaml'), 'rb') as f:
+            sum_specs = yaml.load(f, Loader=yaml.CLoader)
 
         impl_lib = sum_specs['impl_lib']
         grid_specs = sum_specs['routing_grid']
@@ -29,14 +30,14 @@ def run_main(prj):
             yaml.dump(div_info, f)
     else:
         with open(test_fname, 'r') as f:
-            div_info = yaml.load(f)
+            div_info = yaml.load(f, Loader=yaml.Loader)
 
-    with open(os.path.join(root_name, 'sin_clk_divider.yaml'), 'r') as f:
-        div_specs = yaml.load(f)
+    with open(os.path.join(root_name, spec_fname), 'rb') as f:
+        div_specs = yaml.load(f, Loader=yaml.CLoader)
 
     div_specs['params'].update(div_info)
 
-    prj.generate_cell(div_specs, SinClkDivider, debug=True)
+    prj.generate_cell(div_specs, SinClkDivider, gen_sch=gen_sch, debug=True)
     # prj.generate_cell(div_specs, SinClkDivider, gen_sch=True, run_lvs=True, debug=True)
 
 
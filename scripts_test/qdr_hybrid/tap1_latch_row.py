@@ -8,8 +8,8 @@ from serdes_ec.layout.qdr_hybrid.tap1 import Tap1LatchRow
 
 
 if __name__ == '__main__':
-    with open('specs_test/serdes_ec/qdr_hybrid/tap1_latch_row.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/serdes_ec/qdr_hybrid/tap1_latch_row.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
@@ -8,8 +8,8 @@ from serdes_ec.layout.qdr_hybrid.tapx import TapXSummerCell
 
 
 if __name__ == '__main__':
-    with open('specs_test/qdr_hybrid/tapx_summer_cell.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/qdr_hybrid/tapx_summer_cell.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
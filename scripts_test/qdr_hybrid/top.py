@@ -7,8 +7,8 @@ from bag.core import BagProject
 from serdes_ec.layout.qdr_hybrid.top import RXTop
 
 if __name__ == '__main__':
-    with open('specs_test/serdes_ec/qdr_hybrid/top.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/serdes_ec/qdr_hybrid/top.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
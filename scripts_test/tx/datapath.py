@@ -8,8 +8,8 @@ from serdes_ec.layout.tx.datapath import TXDatapath
 
 
 if __name__ == '__main__':
-    with open('specs_test/serdes_ec/tx/datapath.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/serdes_ec/tx/datapath.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
@@ -8,8 +8,8 @@ from serdes_ec.layout.tx.ser import Serializer32
 
 
 if __name__ == '__main__':
-    with open('specs_test/serdes_ec/tx/ser32.yaml', 'r') as f:
-        block_specs = yaml.load(f)
+    with open('specs_test/serdes_ec/tx/ser32.yaml', 'rb') as f:
+        block_specs = yaml.load(f, Loader=yaml.CLoader)
 
     local_dict = locals()
     if 'bprj' not in local_dict:
@@ -13,9 +13,31 @@ if TYPE_CHECKING:
     from bag.layout.template import TemplateDB
 
 
-def _flip_sd(name):
-    # type: (str) -> str
-    return 'd' if name == 's' else 's'
+# required number of segments granularity for each transistor type.
+_SEG_MOD = {'tail_cap': 4, 'load_cap': 4, 'load': 2, 'casc': 2, 'in': 2, 'tail_ref': 2, 'load_ref': 2}
+
+# nmos rows of diffamp from top to bottom.  Each entry is
+# (transistor type, down wire name, True if transistor is center-aligned).
+_DIFFAMP_TRAN_ROWS = (('casc', 'mid', True),
+                      ('in', 'tail', True),
+                      ('sw', 'tail', False),
+                      ('en', 'foot', False),
+                      ('tail', 'VSS', False),
+                      )
+
+# diffamp rows from top to bottom.  Each entry is
+# (transistor type, positive gate net, negative gate net, up wire is differential,
+#  down wire is differential).
+_DIFFAMP_ROWS = (('load', 'bias_load', 'bias_load', False, True),
+                 ('casc', 'bias_casc', 'bias_casc', True, True),
+                 ('in', 'inp', 'inn', True, False),
+                 ('sw', 'clk_sw', 'clk_sw', False, False),
+                 ('en', 'enable', 'enable', False, False),
+                 ('tail', 'bias_tail', 'bias_tail', False, False),
+                 )
+
+# maps source/drain to the opposite terminal.
+_FLIP_SD = {'s': 'd', 'd': 's'}
 
 
 class SerdesRXBaseInfo(AnalogBaseInfo):
@@ -49,10 +71,6 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
 
     def _get_diffamp_tran_info(self, seg_dict, fg_center, flip_out_sd):
         # type: (Dict[str, int], int, bool) -> Tuple[Dict[str, Tuple[Union[int, str]]], bool]
-        tran_types = ['casc', 'in', 'sw', 'en', 'tail']
-        dn_names = ['mid', 'tail', 'tail', 'foot', 'VSS']
-        centers = [True, True, False, False, False]
-
         # we need separation if we use cascode transistor or if technology cannot abut transistors
         fg_cas = seg_dict.get('fg_cas', 0)
         need_sep = fg_cas > 0 or not self.abut_analog_mos
@@ -72,7 +90,7 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
             up_type = 's' if fg_load >= fg_gm or (fg_load - fg_gm) % 4 == 0 else 'd'
             # flip output source/drain if needed
             if flip_out_sd:
-                up_type = _flip_sd(up_type)
+                up_type = _FLIP_SD[up_type]
 
             if up_type == 's':
                 tran_info['load'] = (fg_diff, dn_name, up_name, 0, 2)
@@ -81,13 +99,13 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
 
             fg_prev = fg_load
             up_name = dn_name
-            up_type = _flip_sd(up_type)
+            up_type = _FLIP_SD[up_type]
         else:
             up_name = 'out'
             up_type = 's' if flip_out_sd else 'd'
 
         # get nmos transistors information
-        for tran_type, dn_name, center in zip(tran_types, dn_names, centers):
+        for tran_type, dn_name, center in _DIFFAMP_TRAN_ROWS:
             fg = seg_dict.get(tran_type, 0)
             if fg > 0:
                 # first compute fg_diff (# fingers between inner edge and center) and up wire type.
@@ -96,7 +114,7 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
                     fg_diff = (fg_center - fg) // 2
                     # because we align at the center, check if we need to flip source/drain
                     if fg_prev > 0 and (fg - fg_prev) % 4 != 0:
-                        up_type = _flip_sd(up_type)
+                        up_type = _FLIP_SD[up_type]
                 else:
                     # we align the inner edge of this transistor towards the center,
                     # but at the same time we want to minimize number of vertical wires.
@@ -128,7 +146,7 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
                     # for tail switch transistor it's special; the down wire type is the
                     # same as down wire type of input, and up wire is always vddn.
                     up_name = 'vddn'
-                    up_type = _flip_sd(up_type)
+                    up_type = _FLIP_SD[up_type]
 
                 # we need separation if there's unused middle transistors on any row
                 if fg_diff > 0:
@@ -142,7 +160,7 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
                 # compute information for next row
                 fg_prev = fg
                 up_name = dn_name
-                up_type = _flip_sd(up_type)
+                up_type = _FLIP_SD[up_type]
 
         return tran_info, need_sep
 
@@ -188,14 +206,12 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
                 transistor row layout information dictionary.
         """
         # error checking
-        for cap_name in ('tail_cap', 'load_cap'):
-            seg_cur = seg_dict.get(cap_name, 0)
-            if seg_cur % 4 != 0:
-                raise ValueError('seg_%s = %d must be multiples of 4.' % (cap_name, seg_cur))
-        for even_name in ('load', 'casc', 'in', 'tail_ref', 'load_ref'):
-            seg_cur = seg_dict.get(even_name, 0)
-            if seg_cur % 2 != 0:
-                raise ValueError('seg_%s = %d must be even.' % (even_name, seg_cur))
+        for name, seg_cur in seg_dict.items():
+            mod = _SEG_MOD.get(name, 1)
+            if seg_cur % mod != 0:
+                if mod == 2:
+                    raise ValueError('seg_%s = %d must be even.' % (name, seg_cur))
+                raise ValueError('seg_%s = %d must be multiples of %d.' % (name, seg_cur, mod))
 
         # determine number of center fingers
         fg_load = seg_dict.get('load', 0)
@@ -228,10 +244,11 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
             # NOTE: we always need separation between tail reference and tail transistors,
             # otherwise middle dummies in other nmos rows cannot be connected.
             fg_sep = max(fg_sep, fg_tail_ref + 2 * (self.min_fg_sep - fg_diff_tail))
-        # fg_sep from need_sep constraint
-        if need_sep:
-            for info in tran_info.values():
-                fg_sep = max(fg_sep, self.min_fg_sep - 2 * info[0])
+        # fg_sep from need_sep constraint.  Only the row closest to the center matters,
+        # and nothing changes if technology has no minimum separation.
+        if need_sep and self.min_fg_sep > 0:
+            fg_diff_min = min((info[0] for info in tran_info.values()))
+            fg_sep = max(fg_sep, self.min_fg_sep - 2 * fg_diff_min)
 
         # determine number of side fingers
         fg_side = 0
@@ -270,14 +287,10 @@ class SerdesRXBaseInfo(AnalogBaseInfo):
 
         # get total number of fingers and number of dummies on each edge.
         fg_single = max(fg_center, fg_side)
-        fg_tot = fg_single * 2 + fg_sep + 2 * fg_dum
-        if fg_tot < fg_min:
-            # add dummies to get to fg_min
-            if (fg_min - fg_tot) % 2 != 0:
-                fg_min += 1
-
-            fg_dum = (fg_min - fg_tot) // 2
-            fg_tot = fg_min
+        fg_core = fg_single * 2 + fg_sep
+        # add dummies to get to fg_min
+        fg_dum = max(fg_dum, -(-(fg_min - fg_core) // 2))
+        fg_tot = fg_core + 2 * fg_dum
 
         # determine output source/drain type.
         results = dict(
@@ -344,10 +357,12 @@ class SerdesRXBase(AnalogBase, metaclass=abc.ABCMeta):
         row_idx : int
             the row index.
         """
-        if name in self._nrow_idx:
-            return 'nch', self._nrow_idx[name]
-        if name in self._prow_idx:
-            return 'pch', self._prow_idx[name]
+        row_idx = self._nrow_idx.get(name, None)
+        if row_idx is not None:
+            return 'nch', row_idx
+        row_idx = self._prow_idx.get(name, None)
+        if row_idx is not None:
+            return 'pch', row_idx
 
         raise ValueError('row %s not found.' % name)
 
@@ -361,26 +376,13 @@ class SerdesRXBase(AnalogBase, metaclass=abc.ABCMeta):
                 return name_base + 'p', name_base + 'n'
         return name_base, name_base
 
-    @staticmethod
-    def _append_to_warr_dict(warr_dict, name, warr):
-        # type: (Dict[str, List[WireArray]], str, WireArray) -> None
-        if name not in warr_dict:
-            warr_dict[name] = []
-        warr_dict[name].append(warr)
-
     def _draw_diffamp_mos(self, col_idx, seg_dict, tran_info, fg_single, fg_dum, fg_sep, net_prefix):
         # type: (int, Dict[str, int], Dict[str, Any], int, int, int, str) -> Dict[str, List[WireArray]]
-        tran_types = ['load', 'casc', 'in', 'sw', 'en', 'tail']
-        gnames = ['bias_load', 'bias_casc', 'in', 'clk_sw', 'enable', 'bias_tail']
-        g_diffs = [False, False, True, False, False, False]
-        up_diffs = [False, True, True, False, False, False]
-        dn_diffs = [True, True, False, False, False, False]
-
         col_l = col_idx + fg_dum + fg_single
         col_r = col_l + fg_sep
 
         warr_dict = {}
-        for tran_type, gname, g_diff, up_diff, dn_diff in zip(tran_types, gnames, g_diffs, up_diffs, dn_diffs):
+        for tran_type, gname_p, gname_n, up_diff, dn_diff in _DIFFAMP_ROWS:
             if tran_type in tran_info:
                 fg = seg_dict[tran_type]
                 fg_diff, dname, sname, ddir, sdir = tran_info[tran_type]
@@ -388,22 +390,18 @@ class SerdesRXBase(AnalogBase, metaclass=abc.ABCMeta):
                     d_diff, s_diff = up_diff, dn_diff
                 else:
                     d_diff, s_diff = dn_diff, up_diff
-                gname_p, gname_n = self._get_diff_names(gname, g_diff)
                 dname_p, dname_n = self._get_diff_names(dname, d_diff, invert=True)
                 sname_p, sname_n = self._get_diff_names(sname, s_diff, invert=True)
 
                 mos_type, row_idx = self.get_row_index(tran_type)
-                p_warrs = self.draw_mos_conn(mos_type, row_idx, col_l - fg_diff - fg, fg, sdir, ddir,
-                                             s_net=net_prefix + sname_p, d_net=net_prefix + dname_p)
-                n_warrs = self.draw_mos_conn(mos_type, row_idx, col_r + fg_diff, fg, sdir, ddir,
-                                             s_net=net_prefix + sname_n, d_net=net_prefix + dname_n)
-
-                self._append_to_warr_dict(warr_dict, gname_p, p_warrs['g'])
-                self._append_to_warr_dict(warr_dict, dname_p, p_warrs['d'])
-                self._append_to_warr_dict(warr_dict, sname_p, p_warrs['s'])
-                self._append_to_warr_dict(warr_dict, gname_n, n_warrs['g'])
-                self._append_to_warr_dict(warr_dict, dname_n, n_warrs['d'])
-                self._append_to_warr_dict(warr_dict, sname_n, n_warrs['s'])
+                # draw positive half on the left, negative half on the right
+                for col, gnet, dnet, snet in ((col_l - fg_diff - fg, gname_p, dname_p, sname_p),
+                                              (col_r + fg_diff, gname_n, dname_n, sname_n)):
+                    warrs = self.draw_mos_conn(mos_type, row_idx, col, fg, sdir, ddir,
+                                               s_net=net_prefix + snet, d_net=net_prefix + dnet)
+                    warr_dict.setdefault(gnet, []).append(warrs['g'])
+                    warr_dict.setdefault(dnet, []).append(warrs['d'])
+                    warr_dict.setdefault(snet, []).append(warrs['s'])
 
         return warr_dict
 
@@ -492,9 +490,9 @@ class SerdesRXBase(AnalogBase, metaclass=abc.ABCMeta):
                 # draw transistor
                 warrs = self.draw_mos_conn(mos_type, row_idx, col_ref, fg_ref, sdir, ddir,
                                            s_net=net_prefix + sname, d_net=net_prefix + dname)
-                self._append_to_warr_dict(warr_dict, gname, warrs['g'])
-                self._append_to_warr_dict(warr_dict, dname, warrs['d'])
-                self._append_to_warr_dict(warr_dict, sname, warrs['s'])
+                warr_dict.setdefault(gname, []).append(warrs['g'])
+                warr_dict.setdefault(dname, []).append(warrs['d'])
+                warr_dict.setdefault(sname, []).append(warrs['s'])
 
         # draw load/tail decap transistor
         for tran_name, mos_type, sup_name in (('tail', 'nch', 'VSS'), ('load', 'pch', 'VDD')):
@@ -511,8 +509,8 @@ class SerdesRXBase(AnalogBase, metaclass=abc.ABCMeta):
                 p_warrs = self.draw_mos_decap(mos_type, row_idx, col_l, fg_cap_single, False, export_gate=True)
                 n_warrs = self.draw_mos_decap(mos_type, row_idx, col_r, fg_cap_single, False, export_gate=True)
                 gname = 'bias_%s' % tran_name
-                self._append_to_warr_dict(warr_dict, gname, p_warrs['g'])
-                self._append_to_warr_dict(warr_dict, gname, n_warrs['g'])
+                warr_dict.setdefault(gname, []).append(p_warrs['g'])
+                warr_dict.setdefault(gname, []).append(n_warrs['g'])
 
         # connect to horizontal wires
         # nets relative index parameters
@@ -564,16 +562,21 @@ class SerdesRXBase(AnalogBase, metaclass=abc.ABCMeta):
         # connect horizontal wires
         result = {}
         inp_tidx, inn_tidx, outp_tidx, outn_tidx = 0, 0, 0, 0
+        # default single wire placement only depends on wire type, so compute once per type.
+        place_info = {}
         for net_name, row_type, tr_type in zip(nets, rows, trns):
             if net_name in warr_dict:
                 mos_type, row_idx = self.get_row_index(row_type)
-                tr_w = tr_manager.get_width(hm_layer, tr_type_dict[net_name])
+                wire_type = tr_type_dict[net_name]
+                tr_w = tr_manager.get_width(hm_layer, wire_type)
                 if net_name in tr_indices:
                     # use specified relative index
                     tr_idx = tr_indices[net_name]
                 else:
                     # compute default relative index.  Try to use the tracks closest to transistor.
-                    ntr_used, (tr_idx, ) = tr_manager.place_wires(hm_layer, [tr_type_dict[net_name]])
+                    if wire_type not in place_info:
+                        place_info[wire_type] = tr_manager.place_wires(hm_layer, [wire_type])
+                    ntr_used, (tr_idx, ) = place_info[wire_type]
                     ntr_tot = self.get_num_tracks(mos_type, row_idx, tr_type)
                     if ntr_tot < ntr_used:
                         raise ValueError('Need at least %d %s tracks to draw %s track' % (ntr_used, tr_type, net_name))
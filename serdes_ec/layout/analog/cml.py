@@ -5,8 +5,6 @@
 
 from typing import TYPE_CHECKING, Dict, Set, Any, Tuple, Union
 
-from itertools import chain
-
 from bag.util.search import BinaryIterator
 from bag.layout.util import BBox
 from bag.layout.routing.base import TrackID, TrackManager
@@ -178,11 +176,12 @@ class CMLGmPMOS(AnalogBase):
         vdd_m_list = []
         outp_list = []
         outn_list = []
+        out_vtid_list = []
         layout_info = self.layout_info
         num_out = len(out_xc_list)
         for idx, xc in enumerate(out_xc_list):
             ym_idx = self.grid.coord_to_track(ym_layer, xc, unit_mode=True)
-            vtid = TrackID(ym_layer, ym_idx, width=ym_tr_w)
+            out_vtid_list.append(TrackID(ym_layer, ym_idx, width=ym_tr_w))
             # find column index that centers on given track index
             x_coord = self.grid.track_to_coord(ym_layer, ym_idx, unit_mode=True)
             col_center = layout_info.coord_to_col(x_coord, unit_mode=True)
@@ -212,16 +211,15 @@ class CMLGmPMOS(AnalogBase):
             tail_list.append(mtail['d'])
             vdd_m_list.append(mtail['s'])
             vdd_m_list.append(mref['s'])
+            outp_list.append(mtop['s'])
+            outn_list.append(mbot['s'])
 
-            outp_h = self.connect_to_tracks(mtop['s'], outp_tid)
-            outp_list.append(outp_h)
+        # connect all output segments on one horizontal wire, then bring each up to ym layer
+        outp_h = self.connect_to_tracks(outp_list, outp_tid)
+        outn_h = self.connect_to_tracks(outn_list, outn_tid)
+        for vtid in out_vtid_list:
             self.add_pin('ioutp', self.connect_to_tracks(outp_h, vtid), show=show_pins)
-            outn_h = self.connect_to_tracks(mbot['s'], outn_tid)
-            outn_list.append(outn_h)
             self.add_pin('ioutn', self.connect_to_tracks(outn_h, vtid), show=show_pins)
-
-        self.connect_wires(outp_list)
-        self.connect_wires(outn_list)
         self.add_pin('inp', self.connect_to_tracks(inp_list, inp_tid,
                                                    track_lower=0, unit_mode=True), show=show_pins)
         self.add_pin('inn', self.connect_to_tracks(inn_list, inn_tid,
@@ -239,9 +237,7 @@ class CMLGmPMOS(AnalogBase):
             vtid = TrackID(ym_layer, tidx, width=ym_tr_w)
             right_tidx = max(right_tidx, tidx)
             self.add_pin('VDD', self.connect_to_tracks(vdd_warrs, vtid), show=show_pins)
-        for xc in out_xc_list:
-            tidx = self.grid.coord_to_track(ym_layer, xc, unit_mode=True)
-            vtid = TrackID(ym_layer, tidx, width=ym_tr_w)
+        for vtid in out_vtid_list:
             self.add_pin('VDD', self.connect_to_tracks(vdd_m, vtid), show=show_pins)
 
         self.fill_box = bnd_box = self.bound_box
@@ -366,8 +362,8 @@ class CMLAmpPMOS(TemplateBase):
             self.reexport(gm.get_port(name), show=show_pins)
 
         # connect outputs and supplies to upper layer
-        outp_list = list(chain(res_top.port_pins_iter('out'), gm.port_pins_iter('ioutp')))
-        outn_list = list(chain(res_bot.port_pins_iter('out'), gm.port_pins_iter('ioutn')))
+        outp_list = res_top.get_all_port_pins('out') + gm.get_all_port_pins('ioutp')
+        outn_list = res_bot.get_all_port_pins('out') + gm.get_all_port_pins('ioutn')
         outp_list = self.connect_wires(outp_list)[0].to_warr_list()
         outn_list = self.connect_wires(outn_list)[0].to_warr_list()
         vdd_list = gm.get_all_port_pins('VDD')
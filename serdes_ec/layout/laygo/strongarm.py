@@ -423,9 +423,8 @@ class SenseAmpStrongArm(LaygoBase):
         nand_gtl_tid = self.get_wire_id(row_off + 3, 'g', wire_idx=1)
         nand_gtr_tid = self.get_wire_id(row_off + 4, 'g', wire_idx=0)
         nand_gbr_tid = self.get_wire_id(row_off + 4, 'g', wire_idx=1)
-        nand_nmos_out_tid = self.get_wire_id(row_off + 3, 'gb', wire_idx=0)
-        nand_outnl = self.connect_to_tracks(nandnl['d'], nand_nmos_out_tid, min_len_mode=0)
-        nand_outnr = self.connect_to_tracks(nandnr['d'], nand_nmos_out_tid, min_len_mode=0)
+        nand_outnl = self.connect_to_tracks(nandnl['d'], nout_tid, min_len_mode=0)
+        nand_outnr = self.connect_to_tracks(nandnr['d'], nout_tid, min_len_mode=0)
 
         nand_gtl = [nandnl['g1'], nandpl['g1'], nandpr['d'], nbufr['g'], pbufr['g']]
         nand_gtr = [nandnr['g1'], nandpr['g1'], nandpl['d'], nbufl['g'], pbufl['g']]
@@ -437,15 +436,15 @@ class SenseAmpStrongArm(LaygoBase):
         nand_gbl = self.connect_to_tracks([nandnl['g0'], nandpl['g0']], nand_gbl_tid)
         nand_gbr = self.connect_to_tracks([nandnr['g0'], nandpr['g0']], nand_gbr_tid)
 
-        # connect buffer
-        buf_pmos_out_tid = self.get_wire_id(row_off + 4, 'gb', wire_idx=0)
-        buf_noutl = self.connect_to_tracks(nbufl['d'], nand_nmos_out_tid, min_len_mode=0)
-        buf_noutr = self.connect_to_tracks(nbufr['d'], nand_nmos_out_tid, min_len_mode=0)
-        buf_poutl = self.connect_to_tracks(pbufl['d'], buf_pmos_out_tid, min_len_mode=0)
-        buf_poutr = self.connect_to_tracks(pbufr['d'], buf_pmos_out_tid, min_len_mode=0)
+        # connect buffer.  Buffer outputs share the latch output tracks.
+        buf_noutl = self.connect_to_tracks(nbufl['d'], nout_tid, min_len_mode=0)
+        buf_noutr = self.connect_to_tracks(nbufr['d'], nout_tid, min_len_mode=0)
+        buf_poutl = self.connect_to_tracks(pbufl['d'], pout_tid, min_len_mode=0)
+        buf_poutr = self.connect_to_tracks(pbufr['d'], pout_tid, min_len_mode=0)
 
         # connect buffer ym wires
         ym_w_out = tr_manager.get_width(ym_layer, 'out')
+        ym_sp_out = tr_manager.get_space(ym_layer, ('out', 'out'))
         outb_tid = self.grid.coord_to_nearest_track(ym_layer, buf_noutl.middle_unit,
                                                     half_track=True, mode=1, unit_mode=True)
         out_tid = self.grid.coord_to_nearest_track(ym_layer, buf_noutr.middle_unit,
@@ -474,7 +473,7 @@ class SenseAmpStrongArm(LaygoBase):
         self.add_pin('qp', nand_outl, show=export_probe)
         self.add_pin('qn', nand_outr, show=export_probe)
 
-        ym_pitch_out = tr_manager.get_space(ym_layer, ('out', 'out')) + ym_w_out
+        ym_pitch_out = ym_sp_out + ym_w_out
         nand_inn_tid = nand_outl_id - ym_pitch_out
         nand_inp_tid = nand_outr_id + ym_pitch_out
         self.connect_differential_tracks(nand_gbl, nand_gbr, ym_layer, nand_inn_tid,
@@ -488,19 +487,17 @@ class SenseAmpStrongArm(LaygoBase):
             clk_warr = self.connect_to_tracks(clk_warr, clk_tid)
         self.add_pin('clk', clk_warr, show=show_pins)
 
-        tr_w_out_ym = tr_manager.get_width(ym_layer, 'out')
-        sp_out_ym = tr_manager.get_space(ym_layer, ('out', 'out')) + tr_w_out_ym
-        op_tid = TrackID(ym_layer, op_idx, width=tr_w_out_ym)
+        op_tid = TrackID(ym_layer, op_idx, width=ym_w_out)
         outp1 = self.connect_to_tracks([poutp, noutp], op_tid)
-        on_tid = TrackID(ym_layer, on_idx, width=tr_w_out_ym)
+        on_tid = TrackID(ym_layer, on_idx, width=ym_w_out)
         outn1 = self.connect_to_tracks([poutn, noutn], on_tid)
-        op_tid = TrackID(ym_layer, on_idx + sp_out_ym, width=tr_w_out_ym)
-        on_tid = TrackID(ym_layer, op_idx - sp_out_ym, width=tr_w_out_ym)
+        op_tid = TrackID(ym_layer, on_idx + ym_pitch_out, width=ym_w_out)
+        on_tid = TrackID(ym_layer, op_idx - ym_pitch_out, width=ym_w_out)
         outp2 = self.connect_to_tracks(invgn, op_tid)
         outn2 = self.connect_to_tracks(invgp, on_tid)
 
-        ym_sp_out = tr_manager.get_space(ym_layer, ('out', 'out'))
-        sp_out_mid = sp_out_ym + ym_sp_out + (ym_w_out + tr_w_out_ym) / 2
+        # mid wires are two output pitches away from outp/outn
+        sp_out_mid = 2 * ym_pitch_out
         mn_tid = TrackID(ym_layer, on_idx + sp_out_mid, width=ym_w_out)
         mp_tid = TrackID(ym_layer, op_idx - sp_out_mid, width=ym_w_out)
         self.connect_to_tracks([nmidn, pmidn], mn_tid)
@@ -209,7 +209,7 @@ class TXDatapath(TemplateBase):
         fill_config = self.params['fill_config']
 
         with open(esd_fname, 'r') as f:
-            esd_params = yaml.load(f)
+            esd_params = yaml.load(f, Loader=yaml.Loader)
 
         amp_params['tr_widths'] = tr_widths
         amp_params['tr_spaces'] = tr_spaces
@@ -332,9 +332,9 @@ class Serializer32(TemplateBase):
         out_tid = self.params['out_tid']
 
         with open(ser16_fname, 'r') as f:
-            ser_params = yaml.load(f)
+            ser_params = yaml.load(f, Loader=yaml.Loader)
         with open(mux_fname, 'r') as f:
-            mux_params = yaml.load(f)
+            mux_params = yaml.load(f, Loader=yaml.Loader)
 
         ser_params['show_pins'] = False
         master_ser = self.new_template(params=ser_params, temp_cls=BlackBoxTemplate)